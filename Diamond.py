@@ -67,17 +67,57 @@ def clean_diamond_data(uploaded_file):
 
     return df, None
 
-def cheap_diamonds_by_carat(df, group_columns, price_column="price", carat_column="carat"):
+def top_k_rows(chunks, k, sort_column, ascending=False, buffer_size=10_000):
     """
-    Identifierar prisvärda diamanter genom att jämföra varje diamants pris med medianpriset
-    för andra diamanter med samma egenskaper (inkl. carat).
+    Väljer ut de k bästa raderna ur en ström av DataFrames utan att sortera allt.
 
-    Returnerar en DataFrame med diamanter vars pris är under medianen för sin grupp.
+    Kandidaterna samlas i en buffert som reduceras till k rader med np.argpartition
+    så fort den växer över buffer_size (minst 2k), så bufferten hålls begränsad
+    oavsett hur många rader som strömmas igenom. Endast de k vinnarna sorteras till slut.
+
+    Parametrar:
+    - chunks: En iterator av DataFrames (t.ex. en per grupp eller en per filbit).
+    - k (int): Antal rader att behålla.
+    - sort_column (str): Kolumnen som rangordnar raderna.
+    - ascending (bool): True för att behålla de minsta värdena, annars de största.
+    - buffer_size (int): Antal kandidatrader som samlas innan de reduceras till k.
+
+    Returnerar:
+    - DataFrame med högst k rader, sorterad efter sort_column.
     """
+    def reduce(frames):
+        candidates = pd.concat(frames, ignore_index=True)
+        if len(candidates) <= k:
+            return candidates
+        values = candidates[sort_column].to_numpy(dtype=float)
+        if not ascending:
+            values = -values
+        return candidates.iloc[np.argpartition(values, k - 1)[:k]]
+
+    if k <= 0:
+        return pd.DataFrame()
+
+    limit = max(2 * k, buffer_size)
+    buffer = []
+    buffered = 0
+    for chunk in chunks:
+        if chunk.empty:
+            continue
+        buffer.append(chunk)
+        buffered += len(chunk)
+        if buffered > limit:
+            buffer = [reduce(buffer)]
+            buffered = len(buffer[0])
+
+    if not buffer:
+        return pd.DataFrame()
+    best = reduce(buffer)
+    return best.sort_values(by=sort_column, ascending=ascending).reset_index(drop=True)
+
+def _cheap_groups(df, group_columns, price_column, carat_column):
     df = df[df[carat_column] <= 1.0].copy()
     df['carat_bin'] = pd.cut(df[carat_column], bins=np.arange(0.1, 1, 0.01))
 
-    result = []
     groups = df.groupby(group_columns + ['carat_bin'])
 
     for name, group in groups:
@@ -97,8 +137,24 @@ def cheap_diamonds_by_carat(df, group_columns, price_column="price", carat_colum
         cheap["cut"] = group.loc[cheap.index, "cut"].values
         cheap["carat_bin"] = group.loc[cheap.index, "carat_bin"].values
 
-        result.append(cheap)
+        yield cheap
+
+def cheap_diamonds_by_carat(df, group_columns, price_column="price", carat_column="carat", top_k=None):
+    """
+    Identifierar prisvärda diamanter genom att jämföra varje diamants pris med medianpriset
+    för andra diamanter med samma egenskaper (inkl. carat).
+
+    Returnerar en DataFrame med diamanter vars pris är under medianen för sin grupp.
+    Om top_k anges returneras bara de top_k diamanterna med störst avstånd till medianen
+    (un_med_usd), sorterade fallande. Då slås gruppernas resultat aldrig ihop till en
+    stor DataFrame och sorteras inte i sin helhet. Indatan filtreras och grupperas
+    däremot fortfarande i sin helhet i minnet.
+    """
+    cheap_groups = _cheap_groups(df, group_columns, price_column, carat_column)
+    if top_k is not None:
+        return top_k_rows(cheap_groups, top_k, "un_med_usd")
 
+    result = list(cheap_groups)
     return pd.concat(result, ignore_index=True) if result else pd.DataFrame()
 
 
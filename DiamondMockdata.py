@@ -0,0 +1,234 @@
+import numpy as np
+import pandas as pd
+
+CUTS = ["Ideal", "Premium", "Very Good", "Good", "Fair"]
+CUT_WEIGHTS = [0.40, 0.26, 0.22, 0.09, 0.03]
+CUT_FACTOR = [1.10, 1.05, 1.00, 0.93, 0.82]
+
+COLORS = ['D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L',
+          'M', 'N', 'O', 'P', 'Q', 'R', 'S', 'T', 'U',
+          'V', 'W', 'X', 'Y', 'Z']
+COLOR_WEIGHTS = np.array([12, 18, 18, 21, 15, 10, 5] + [0.5] * 16, dtype=float)
+COLOR_WEIGHTS /= COLOR_WEIGHTS.sum()
+COLOR_FACTOR = 1.25 * 0.93 ** np.arange(len(COLORS))
+
+CLARITIES = ['FL', 'IF', 'VVS1', 'VVS2', 'VS1', 'VS2',
+             'SI1', 'SI2', 'SI3', 'I1', 'I2', 'I3']
+CLARITY_WEIGHTS = np.array([0.5, 3, 7, 9, 15, 22, 23, 16, 1.5, 2, 0.5, 0.5])
+CLARITY_WEIGHTS /= CLARITY_WEIGHTS.sum()
+CLARITY_FACTOR = 1.5 * 0.9 ** np.arange(len(CLARITIES))
+
+COLUMNS = ['index', 'carat', 'cut', 'color', 'clarity', 'depth', 'table', 'price', 'x', 'y', 'z']
+
+BLOCK_SIZE = 10_000
+
+FAILURE_MODES = ["missing", "non_positive", "too_large", "small_but_deep",
+                 "depth_mismatch", "bad_cut", "bad_color", "bad_clarity"]
+
+
+def _valid_rows(rng, n_rows):
+    """Slumpar fram rimliga diamanter där mått, djup och pris hänger ihop med carat."""
+    carat = np.clip(rng.lognormal(mean=np.log(0.7), sigma=0.55, size=n_rows), 0.2, 5.0).round(2)
+
+    cut_idx = rng.choice(len(CUTS), size=n_rows, p=CUT_WEIGHTS)
+    color_idx = rng.choice(len(COLORS), size=n_rows, p=COLOR_WEIGHTS)
+    clarity_idx = rng.choice(len(CLARITIES), size=n_rows, p=CLARITY_WEIGHTS)
+
+    x = (6.45 * np.cbrt(carat) * rng.normal(1.0, 0.015, n_rows)).round(2)
+    y = (x * rng.normal(1.0, 0.006, n_rows)).round(2)
+    depth_pct = rng.normal(61.8, 1.4, n_rows)
+    z = (depth_pct / 100 * (x + y) / 2).round(2)
+    depth = (z / ((x + y) / 2) * 100).round(1)
+    table = rng.normal(57.5, 2.2, n_rows).round(1)
+
+    price = (4200 * carat ** 1.8
+             * np.take(CUT_FACTOR, cut_idx)
+             * COLOR_FACTOR[color_idx]
+             * CLARITY_FACTOR[clarity_idx]
+             * rng.lognormal(0.0, 0.15, n_rows))
+    price = np.clip(price, 326, None).round(0)
+
+    return pd.DataFrame({
+        'carat': carat,
+        'cut': np.take(CUTS, cut_idx),
+        'color': np.take(COLORS, color_idx),
+        'clarity': np.take(CLARITIES, clarity_idx),
+        'depth': depth,
+        'table': table,
+        'price': price,
+        'x': x,
+        'y': y,
+        'z': z,
+    })
+
+
+def _break_rows(rng, df, invalid_share):
+    """Gör en andel av raderna ogiltiga enligt de fel som clean_diamond_data filtrerar bort."""
+    broken = rng.random(len(df)) < invalid_share
+    n_broken = int(broken.sum())
+    if n_broken == 0:
+        return df
+
+    rows = np.flatnonzero(broken)
+    modes = rng.integers(0, len(FAILURE_MODES), size=n_broken)
+
+    def pick(mode):
+        return rows[modes == FAILURE_MODES.index(mode)]
+
+    idx = pick("missing")
+    columns = rng.choice(['cut', 'color', 'clarity', 'price', 'carat', 'x', 'y', 'z', 'depth'], size=len(idx))
+    for col in np.unique(columns):
+        df.iloc[idx[columns == col], df.columns.get_loc(col)] = None
+
+    idx = pick("non_positive")
+    columns = rng.choice(['x', 'y', 'z'], size=len(idx))
+    for col in np.unique(columns):
+        df.iloc[idx[columns == col], df.columns.get_loc(col)] = 0.0
+
+    idx = pick("too_large")
+    columns = rng.choice(['x', 'y', 'z'], size=len(idx))
+    for col in np.unique(columns):
+        df.iloc[idx[columns == col], df.columns.get_loc(col)] = rng.uniform(15.5, 60.0, size=int((columns == col).sum())).round(2)
+
+    idx = pick("small_but_deep")
+    df.iloc[idx, df.columns.get_loc('carat')] = rng.uniform(0.2, 0.99, size=len(idx)).round(2)
+    df.iloc[idx, df.columns.get_loc('z')] = rng.uniform(10.5, 15.0, size=len(idx)).round(2)
+
+    idx = pick("depth_mismatch")
+    shift = rng.uniform(2.0, 50.0, size=len(idx)) * rng.choice([-1, 1], size=len(idx))
+    df.iloc[idx, df.columns.get_loc('depth')] = (df['depth'].iloc[idx] + shift).round(1)
+
+    df.iloc[pick("bad_cut"), df.columns.get_loc('cut')] = "Excellent"
+    df.iloc[pick("bad_color"), df.columns.get_loc('color')] = "A"
+    df.iloc[pick("bad_clarity"), df.columns.get_loc('clarity')] = "VS3"
+
+    return df
+
+
+def _block(entropy, block_no, invalid_share):
+    """Skapar block nummer block_no med en egen slumpgenerator härledd från fröet."""
+    rng = np.random.default_rng(np.random.SeedSequence(entropy, spawn_key=(block_no,)))
+    df = _valid_rows(rng, BLOCK_SIZE)
+    return _break_rows(rng, df, invalid_share)
+
+
+def generate_diamond_data(n_rows, seed=None, invalid_share=0.0, chunk_size=1_000_000):
+    """
+    Genererar syntetisk diamantdata i bitar (chunks) så att även mycket stora dataset
+    kan skapas utan att allt hålls i minnet samtidigt.
+
+    Carat styr mått (x, y, z), djup och pris, och cut/färg/clarity väljs bland de
+    tillåtna graderna i clean_diamond_data. En valbar andel rader görs ogiltiga med
+    samma typer av fel som rensningen ska fånga (saknade värden, orimliga mått,
+    avvikande djup och okända grader).
+
+    Datan slumpas i fasta block om BLOCK_SIZE rader som var och en får en egen
+    slumpgenerator härledd från fröet, så resultatet beror inte på chunk_size.
+
+    Parametrar:
+    - n_rows (int): Totalt antal rader.
+    - seed (int eller None): Frö för slumpgeneratorn, samma frö ger samma data oavsett chunk_size.
+    - invalid_share (float): Andel ogiltiga rader, mellan 0 och 1.
+    - chunk_size (int): Max antal rader per chunk.
+
+    Argumenten kontrolleras direkt vid anropet, inte först när generatorn börjar läsas.
+
+    Returnerar:
+    - En generator av DataFrames med samma kolumner som mockfilerna.
+    """
+    if n_rows < 0:
+        raise ValueError("n_rows får inte vara negativt.")
+    if not 0 <= invalid_share <= 1:
+        raise ValueError("invalid_share måste ligga mellan 0 och 1.")
+    if chunk_size <= 0:
+        raise ValueError("chunk_size måste vara större än 0.")
+
+    return _generate(n_rows, seed, invalid_share, chunk_size)
+
+
+def _generate(n_rows, seed, invalid_share, chunk_size):
+    """Själva generatorn bakom generate_diamond_data, anropas först efter att argumenten kontrollerats."""
+    entropy = np.random.SeedSequence(seed).entropy
+    pending = []
+    pending_rows = 0
+    block_no = 0
+    start = 0
+    while start < n_rows:
+        size = min(chunk_size, n_rows - start)
+        while pending_rows < size:
+            block = _block(entropy, block_no, invalid_share)
+            pending.append(block)
+            pending_rows += len(block)
+            block_no += 1
+
+        buffer = pd.concat(pending, ignore_index=True) if len(pending) > 1 else pending[0]
+        df = buffer.iloc[:size].reset_index(drop=True)
+        rest = buffer.iloc[size:]
+        pending = [rest] if len(rest) else []
+        pending_rows = len(rest)
+
+        df.insert(0, 'index', np.arange(start + 1, start + size + 1))
+        yield df[COLUMNS]
+        start += size
+
+
+def write_diamond_data(path, n_rows, seed=None, invalid_share=0.0, chunk_size=1_000_000, file_format=None):
+    """
+    Skriver syntetisk diamantdata till CSV (semikolonseparerad som mockfilerna) eller
+    Parquet, en chunk i taget.
+
+    Formatet väljs från filändelsen om file_format inte anges. Parquet kräver pyarrow.
+    Ogiltiga argument ger ValueError innan filen öppnas, så en befintlig fil lämnas orörd.
+
+    Returnerar:
+    - Antal skrivna rader.
+    """
+    if file_format is None:
+        file_format = "parquet" if str(path).lower().endswith(".parquet") else "csv"
+    if file_format not in ("csv", "parquet"):
+        raise ValueError(f"Okänt filformat: {file_format}")
+
+    chunks = generate_diamond_data(n_rows, seed=seed, invalid_share=invalid_share, chunk_size=chunk_size)
+    written = 0
+
+    if file_format == "csv":
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            f.write(";".join(COLUMNS) + "\n")
+            for chunk in chunks:
+                chunk.to_csv(f, sep=";", header=False, index=False)
+                written += len(chunk)
+        return written
+
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Parquet-export kräver pyarrow – installera med 'pip install pyarrow'.")
+
+    schema = pa.schema([
+        ('index', pa.int64()), ('carat', pa.float64()), ('cut', pa.string()),
+        ('color', pa.string()), ('clarity', pa.string()), ('depth', pa.float64()),
+        ('table', pa.float64()), ('price', pa.float64()), ('x', pa.float64()),
+        ('y', pa.float64()), ('z', pa.float64()),
+    ])
+    with pq.ParquetWriter(path, schema) as writer:
+        for chunk in chunks:
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+            written += len(chunk)
+    return written
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Genererar syntetisk diamantdata för last- och skalningstester.")
+    parser.add_argument("path", help="Utfil (.csv eller .parquet)")
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--invalid-share", type=float, default=0.0)
+    parser.add_argument("--chunk-size", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    n = write_diamond_data(args.path, args.rows, seed=args.seed,
+                           invalid_share=args.invalid_share, chunk_size=args.chunk_size)
+    print(f"Skrev {n} rader till {args.path}")
@@ -232,14 +232,13 @@ def run_app(clean_diamond_data):
         ].copy()
         filtered['carat_bin'] = pd.cut(filtered['carat'], bins=np.arange(0.1, 1, 0.01))
 
-        cheap = cheap_diamonds_by_carat(filtered, ['carat_bin', 'color', 'clarity', 'cut'])
+        cheap = cheap_diamonds_by_carat(filtered, ['carat_bin', 'color', 'clarity', 'cut'], top_k=50)
         if cheap.empty:
             st.warning("❌ Inga prisvärda diamanter kunde identifieras med vald filtrering.")
             st.stop()
 
-        cheap = cheap.sort_values(by="un_med_usd", ascending=False)
         top50 = cheap[['index','price','med_price', 'un_med_usd', 'un_med_percent',
-            'kategori', 'cut', 'color', 'clarity', 'carat_bin']].head(50)
+            'kategori', 'cut', 'color', 'clarity', 'carat_bin']]
 
         st.markdown("### Topp 50 mest prisvärda diamanter")
         st.dataframe(top50.reset_index(drop=True))
@@ -8,6 +8,8 @@ Funktioner som testas:
 - `clean_diamond_data`: Att korrekt CSV-data returnerar en DataFrame, medan ogiltig data ger tydliga felmeddelanden.
 - `cheap_diamonds_by_carat`: Att diamanter under medianpriset per carat-grupp identifieras korrekt.
 - `calculate_volatility_groups`: Att funktionens logik för att hitta de mest volatila färg- eller klarhetsgrupperna per caratintervall fungerar som avsett.
+- `generate_diamond_data` / `write_diamond_data`: Att den syntetiska datan är reproducerbar, passerar rensningen och att andelen ogiltiga rader fångas.
+- `top_k_rows` / `cheap_diamonds_by_carat(top_k=...)`: Att de k bästa raderna väljs korrekt ur strömmade chunks, i båda sorteringsriktningar, och ger samma resultat som en full sortering.
 
 Dessa tester är viktiga för att upptäcka fel tidigt och förhindra att framtida kodändringar introducerar buggar.
 """
@@ -15,7 +17,11 @@ Dessa tester är viktiga för att upptäcka fel tidigt och förhindra att framti
 from Diamond import clean_diamond_data
 from Diamond import cheap_diamonds_by_carat
 from Diamond import calculate_volatility_groups
+from Diamond import top_k_rows
+from DiamondMockdata import generate_diamond_data, write_diamond_data
+import numpy as np
 import pandas as pd
+import pytest
 
 class MockUploadedFile:
     def __init__(self, content: str):
@@ -129,4 +135,108 @@ def test_calculate_volatility_groups_empty():
     df = pd.DataFrame(columns=['carat', 'price', 'color'])
     result = calculate_volatility_groups(df, 'color')
     assert isinstance(result, pd.Series)
-    assert result.empty
\ No newline at end of file
+    assert result.empty
+
+def test_generate_diamond_data_is_seeded_and_chunked():
+    chunks = list(generate_diamond_data(2500, seed=7, chunk_size=1000))
+    again = pd.concat(generate_diamond_data(2500, seed=7, chunk_size=1000), ignore_index=True)
+
+    assert [len(chunk) for chunk in chunks] == [1000, 1000, 500]
+    assert pd.concat(chunks, ignore_index=True).equals(again)
+    assert list(again['index']) == list(range(1, 2501))
+
+
+def test_generate_diamond_data_does_not_depend_on_chunk_size():
+    small = pd.concat(generate_diamond_data(25000, seed=5, chunk_size=1000), ignore_index=True)
+    large = pd.concat(generate_diamond_data(25000, seed=5, chunk_size=25000), ignore_index=True)
+
+    assert small.equals(large)
+
+
+def test_generated_valid_rows_pass_cleaning(tmp_path):
+    path = tmp_path / "mock.csv"
+    written = write_diamond_data(path, 5000, seed=1, chunk_size=2000)
+    df, error = clean_diamond_data(MockUploadedFile(path.read_text(encoding="utf-8")))
+
+    assert written == 5000
+    assert error is None
+    assert len(df) == 5000
+    assert df['price'].corr(df['carat']) > 0.8
+
+
+def test_generated_invalid_rows_are_removed_by_cleaning(tmp_path):
+    path = tmp_path / "mock_fail.csv"
+    write_diamond_data(path, 5000, seed=2, invalid_share=0.3)
+    df, error = clean_diamond_data(MockUploadedFile(path.read_text(encoding="utf-8")))
+
+    assert error is None
+    assert 0.65 < len(df) / 5000 < 0.75
+
+
+@pytest.mark.parametrize("kwargs", [
+    {'n_rows': -1},
+    {'n_rows': 10, 'invalid_share': 2},
+    {'n_rows': 10, 'chunk_size': 0},
+])
+def test_write_diamond_data_invalid_arguments_keep_existing_file(tmp_path, kwargs):
+    path = tmp_path / "mock.csv"
+    path.write_text("keep me", encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        write_diamond_data(path, **kwargs)
+
+    assert path.read_text(encoding="utf-8") == "keep me"
+
+
+def test_write_diamond_data_parquet(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "mock.parquet"
+    written = write_diamond_data(path, 2500, seed=4, invalid_share=0.1, chunk_size=1000)
+    table = pq.read_table(path)
+
+    assert written == 2500
+    assert table.num_rows == 2500
+    assert table.schema.names == ['index', 'carat', 'cut', 'color', 'clarity', 'depth', 'table', 'price', 'x', 'y', 'z']
+    assert str(table.schema.field('price').type) == "double"
+    assert str(table.schema.field('cut').type) == "string"
+
+def test_cheap_diamonds_top_k_matches_full_sort():
+    df = pd.concat(generate_diamond_data(20000, seed=3), ignore_index=True)
+    full = cheap_diamonds_by_carat(df, ['cut'])
+    top = cheap_diamonds_by_carat(df, ['cut'], top_k=50)
+
+    expected = full.sort_values(by="un_med_usd", ascending=False).head(50)
+    assert len(top) == 50
+    assert list(top['un_med_usd']) == list(expected['un_med_usd'])
+    assert top['un_med_usd'].is_monotonic_decreasing
+
+
+def test_top_k_rows_over_streamed_chunks():
+    chunks = (pd.DataFrame({'value': range(start, start + 100)}) for start in range(0, 1000, 100))
+    result = top_k_rows(chunks, 5, 'value', buffer_size=0)
+
+    assert list(result['value']) == [999, 998, 997, 996, 995]
+    assert top_k_rows(iter([]), 5, 'value').empty
+
+
+def test_top_k_rows_reduces_large_chunks_with_default_buffer():
+    values = np.random.default_rng(0).permutation(100000)
+    chunks = (pd.DataFrame({'value': values[start:start + 25000]}) for start in range(0, 100000, 25000))
+    result = top_k_rows(chunks, 50, 'value')
+
+    assert list(result['value']) == list(range(99999, 99949, -1))
+
+
+def test_top_k_rows_ascending():
+    values = np.random.default_rng(1).permutation(30000)
+    chunks = (pd.DataFrame({'value': values[start:start + 12000]}) for start in range(0, 30000, 12000))
+    result = top_k_rows(chunks, 5, 'value', ascending=True)
+
+    assert list(result['value']) == [0, 1, 2, 3, 4]
+
+
+def test_top_k_rows_fewer_rows_than_k():
+    chunks = [pd.DataFrame({'value': [3, 1]}), pd.DataFrame({'value': [2]})]
+    result = top_k_rows(chunks, 10, 'value')
+
+    assert list(result['value']) == [3, 2, 1]